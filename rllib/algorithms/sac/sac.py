@@ -1,6 +1,7 @@
+import concurrent.futures
+import itertools
 import logging
 import numpy as np
-import tree
 from typing import Any, Dict, List, Optional, Type, Union
 
 from ray.rllib.algorithms.algorithm_config import AlgorithmConfig, NotProvided
@@ -10,7 +11,11 @@ from ray.rllib.core.learner import Learner
 from ray.rllib.core.rl_module.rl_module import SingleAgentRLModuleSpec
 from ray.rllib.env.single_agent_episode import SingleAgentEpisode
 from ray.rllib.policy.policy import Policy
-from ray.rllib.policy.sample_batch import SampleBatch
+from ray.rllib.policy.sample_batch import (
+    DEFAULT_POLICY_ID,
+    MultiAgentBatch,
+    SampleBatch,
+)
 from ray.rllib.utils import deep_update
 from ray.rllib.utils.annotations import override
 from ray.rllib.utils.deprecation import (
@@ -101,6 +106,8 @@ class SACConfig(AlgorithmConfig):
         }
         self.grad_clip = None
         self.target_network_update_freq = 0
+        self.mixed_precision = None
+        self.allow_tf32 = False
 
         # .exploration()
         self.exploration_config = {
@@ -154,6 +161,8 @@ class SACConfig(AlgorithmConfig):
         grad_clip: Optional[float] = NotProvided,
         optimization_config: Optional[Dict[str, Any]] = NotProvided,
         target_network_update_freq: Optional[int] = NotProvided,
+        mixed_precision: Optional[str] = NotProvided,
+        allow_tf32: Optional[bool] = NotProvided,
         _deterministic_loss: Optional[bool] = NotProvided,
         _use_beta_distribution: Optional[bool] = NotProvided,
         num_steps_sampled_before_learning_starts: Optional[int] = NotProvided,
@@ -255,6 +264,14 @@ class SACConfig(AlgorithmConfig):
                 `entropy_learning_rate` in here.
             target_network_update_freq: Update the target network every
                 `target_network_update_freq` steps.
+            mixed_precision: If set to "bf16" or "fp16", the learner's forward
+                passes and loss computation run under `torch.autocast` with the
+                corresponding dtype. "bf16" is recommended (no loss scaling
+                needed); log-alpha and the entropy terms stay in FP32 via
+                autocast's op policies. Only supported for framework="torch".
+            allow_tf32: Whether to allow PyTorch to use TF32 tensor cores for
+                FP32 matmuls on Ampere+ GPUs. Only supported for
+                framework="torch".
             _deterministic_loss: Whether the loss should be calculated deterministically
                 (w/o the stochastic action sampling step). True only useful for
                 continuous actions and for debugging.
@@ -286,15 +303,16 @@ class SACConfig(AlgorithmConfig):
             self.store_buffer_in_checkpoints = store_buffer_in_checkpoints
         if replay_buffer_config is not NotProvided:
             # Override entire `replay_buffer_config` if `type` key changes.
-            # Update, if `type` key remains the same or is not specified.
-            new_replay_buffer_config = deep_update(
-                {"replay_buffer_config": self.replay_buffer_config},
-                {"replay_buffer_config": replay_buffer_config},
-                False,
-                ["replay_buffer_config"],
-                ["replay_buffer_config"],
-            )
-            self.replay_buffer_config = new_replay_buffer_config["replay_buffer_config"]
+            # Update (in place, without rebuilding the dict), if `type` key
+            # remains the same or is not specified.
+            if (
+                "type" in replay_buffer_config
+                and "type" in self.replay_buffer_config
+                and replay_buffer_config["type"] != self.replay_buffer_config["type"]
+            ):
+                self.replay_buffer_config = replay_buffer_config
+            else:
+                deep_update(self.replay_buffer_config, replay_buffer_config, True)
         if training_intensity is not NotProvided:
             self.training_intensity = training_intensity
         if clip_actions is not NotProvided:
@@ -305,6 +323,10 @@ class SACConfig(AlgorithmConfig):
             self.optimization = optimization_config
         if target_network_update_freq is not NotProvided:
             self.target_network_update_freq = target_network_update_freq
+        if mixed_precision is not NotProvided:
+            self.mixed_precision = mixed_precision
+        if allow_tf32 is not NotProvided:
+            self.allow_tf32 = allow_tf32
         if _deterministic_loss is not NotProvided:
             self._deterministic_loss = _deterministic_loss
         if _use_beta_distribution is not NotProvided:
@@ -348,6 +370,12 @@ class SACConfig(AlgorithmConfig):
         if self.grad_clip is not None and self.grad_clip <= 0.0:
             raise ValueError("`grad_clip` value must be > 0.0!")
 
+        if self.mixed_precision not in (None, "bf16", "fp16"):
+            raise ValueError(
+                f"`mixed_precision` ({self.mixed_precision}) must be None, "
+                "'bf16', or 'fp16'!"
+            )
+
         if self.framework in ["tf", "tf2"] and tfp is None:
             logger.warning(
                 "You need `tensorflow_probability` in order to run SAC! "
@@ -418,6 +446,28 @@ class SAC(DQN):
     def __init__(self, *args, **kwargs):
         self._allow_unknown_subkeys += ["policy_model_config", "q_model_config"]
         super().__init__(*args, **kwargs)
+        # Single background thread used to prefetch train batches from the
+        # local replay buffer while the learner group is updating. The thread
+        # is only spawned on first use (new API stack only).
+        self._replay_sample_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="sac_replay_sample"
+        )
+        # Background thread that syncs the updated weights to the rollout
+        # workers after training, so `training_step` can return without
+        # blocking on weight pickling. The pending sync is awaited at the
+        # start of the next `training_step` call.
+        self._weight_sync_executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="sac_weight_sync"
+        )
+        self._weight_sync_future = None
+        # The counter to read the current sampled timesteps from depends only
+        # on the `count_steps_by` setting; resolve the key once instead of
+        # re-evaluating the config on every `training_step`.
+        self._current_ts_key = (
+            NUM_AGENT_STEPS_SAMPLED
+            if self.config.count_steps_by == "agent_steps"
+            else NUM_ENV_STEPS_SAMPLED
+        )
 
     @classmethod
     @override(DQN)
@@ -443,6 +493,17 @@ class SAC(DQN):
         if not self.config.uses_new_env_runners:
             return super().training_step()
 
+        # Finish a weight sync still in flight from the previous call. Keeping
+        # the sync on a background thread moves the (blocking) weight pickling
+        # off this method's critical path; it overlaps with everything that
+        # happens between two `training_step` calls (metrics aggregation,
+        # evaluation, etc.). Waiting here - before any sampling - also makes
+        # sure a local worker never samples while its weights are being set.
+        if self._weight_sync_future is not None:
+            with self._timers[SYNCH_WORKER_WEIGHTS_TIMER]:
+                self._weight_sync_future.result()
+            self._weight_sync_future = None
+
         # Alternate between storing and sampling and training.
         store_weight, sample_and_train_weight = calculate_rr_weights(self.config)
         train_results = {}
@@ -452,70 +513,119 @@ class SAC(DQN):
             with self._timers[SAMPLE_TIMER]:
                 # TODO (simon): Use `sychnronous_parallel_sample()` here.
                 if self.workers.num_remote_workers() <= 0:
-                    episodes: List[SingleAgentEpisode] = [
-                        self.workers.local_worker().sample()
-                    ]
+                    # The local worker returns an already flat episode list.
+                    episodes: List[
+                        SingleAgentEpisode
+                    ] = self.workers.local_worker().sample()
                 else:
-                    episodes: List[SingleAgentEpisode] = self.workers.foreach_worker(
+                    # Sample asynchronously on all remote workers and only
+                    # consume the rollouts that are already done. This way
+                    # adding to the replay buffer and training overlap with
+                    # the still ongoing `sample()` calls. Note, the worker
+                    # manager bounds the number of in-flight requests per
+                    # worker, so outstanding rollouts cannot pile up.
+                    self.workers.foreach_worker_async(
                         lambda w: w.sample(),
-                        local_worker=False,
+                        healthy_only=True,
                     )
+                    episodes: List[SingleAgentEpisode] = [
+                        eps
+                        for _, eps in self.workers.fetch_ready_async_reqs(
+                            timeout_seconds=0.0
+                        )
+                    ]
 
-            episodes = tree.flatten(episodes)
+            # `episodes` is a list of per-worker rollout lists. Chain these
+            # into a single flat list instead of using `tree.flatten`, which
+            # recurses into every element to discover its structure.
+            if episodes and isinstance(episodes[0], list):
+                episodes = list(itertools.chain.from_iterable(episodes))
+            assert not episodes or isinstance(episodes[0], SingleAgentEpisode)
             # TODO (sven): single- vs multi-agent.
-            self._counters[NUM_AGENT_STEPS_SAMPLED] += sum(len(e) for e in episodes)
-            self._counters[NUM_ENV_STEPS_SAMPLED] += sum(len(e) for e in episodes)
+            # Walk the episode list only once and reuse the sum for both
+            # counters. The reduction over the lengths runs in NumPy, which
+            # amortizes well when many workers return many episode chunks.
+            episode_lens = np.fromiter(
+                (len(e) for e in episodes), dtype=np.int64, count=len(episodes)
+            )
+            env_steps = int(episode_lens.sum())
+            self._counters[NUM_AGENT_STEPS_SAMPLED] += env_steps
+            self._counters[NUM_ENV_STEPS_SAMPLED] += env_steps
 
             # Add the sampled experiences to the replay buffer.
             self.local_replay_buffer.add(episodes)
 
         # Update the target network each `target_network_update_freq` steps.
-        current_ts = self._counters[
-            NUM_AGENT_STEPS_SAMPLED
-            if self.config.count_steps_by == "agent_steps"
-            else NUM_ENV_STEPS_SAMPLED
-        ]
+        current_ts = self._counters[self._current_ts_key]
 
         # If enough experiences have been sampled start training.
         if current_ts >= self.config.num_steps_sampled_before_learning_starts:
+            sample_future = None
+            modules_to_update = None
             # Run multiple training iterations.
-            for _ in range(sample_and_train_weight):
-                # Sample training batch from replay_buffer.
-                train_dict = self.local_replay_buffer.sample(
-                    num_items=self.config.train_batch_size,
-                    n_step=self.config.n_step,
-                    gamma=self.config.gamma,
+            for iteration in range(sample_and_train_weight):
+                # Sample training batch from replay_buffer. Use the batch
+                # prefetched in the previous iteration, if available.
+                if sample_future is not None:
+                    train_dict = sample_future.result()
+                    sample_future = None
+                else:
+                    train_dict = self.local_replay_buffer.sample(
+                        num_items=self.config.train_batch_size,
+                        n_step=self.config.n_step,
+                        gamma=self.config.gamma,
+                    )
+                # Wrap directly into a multi-agent batch as `LearnerGroup`
+                # depends on it. This only re-references the sampled arrays
+                # under the default policy ID; no column is copied.
+                single_agent_batch = SampleBatch(train_dict)
+                train_batch = MultiAgentBatch(
+                    {DEFAULT_POLICY_ID: single_agent_batch},
+                    env_steps=single_agent_batch.count,
                 )
-                train_batch = SampleBatch(train_dict)
-
-                # Convert to multi-agent batch as `LearnerGroup` depends on it.
-                train_batch = train_batch.as_multi_agent()
 
                 # TODO (sven, simon): Streamline the custom metrics reduction
                 # functions via the `Learner`'s `register_metrics()` API.
                 def reduce_fn(results: List[ResultDict]) -> ResultDict:
                     """Reduces all metrics, but the TD-errors."""
-                    # First get the single modules' results.
-                    module_results = [
-                        v for res in results for k, v in res.items() if k != "__all__"
+                    # In single-learner setups (the default) there is nothing
+                    # to reduce: all metrics and the td_error arrays are
+                    # already in place.
+                    if len(results) == 1:
+                        return results[0]
+                    # The results always have the shallow, fixed shape
+                    # {module_id: {metric: scalar_or_ndarray}}, so two nested
+                    # dict loops replace dm-tree's generic per-node dispatch
+                    # here. All scalar metrics still go through one stacked
+                    # mean; the td_error arrays are kept as-is.
+                    keys = [
+                        (module_id, k)
+                        for module_id, metrics in results[0].items()
+                        for k in metrics
+                        if k != "td_error"
                     ]
-                    # Extract the TD-errors as we want to keep them as arrays.
-                    td_errors = tree.map_structure_up_to(
-                        {"td_error": True}, lambda x: x, *module_results
-                    )
-                    # Now reduce all other results.
-                    reduced_results = tree.map_structure(
-                        lambda *x: np.mean(x), *results
+                    stacked = np.asarray(
+                        [[r[mid][k] for mid, k in keys] for r in results],
+                        dtype=np.float64,
                     )
-                    # Add the TD-error arrays to the results and return.
-                    return {
-                        k: v if k == "__all__" else {**v, "td_error": td_error}
-                        for k, v, td_error in zip(
-                            reduced_results.keys(),
-                            reduced_results.values(),
-                            [None] + list(td_errors.values()),
-                        )
+                    means = stacked.mean(axis=0).tolist()
+                    reduced = {
+                        module_id: dict(metrics)
+                        for module_id, metrics in results[0].items()
                     }
+                    for (module_id, k), mean in zip(keys, means):
+                        reduced[module_id][k] = mean
+                    # With multiple (DDP) learner workers, each result stems
+                    # from one shard of the train batch. Concatenate the
+                    # per-shard td_error arrays (in shard order) so that the
+                    # buffer's priority update covers every sampled
+                    # transition, not just the first shard's.
+                    for module_id, metrics in results[0].items():
+                        if "td_error" in metrics:
+                            reduced[module_id]["td_error"] = np.concatenate(
+                                [r[module_id]["td_error"] for r in results]
+                            )
+                    return reduced
 
                 # Training on batch.
                 train_results = self.learner_group.update_from_batch(
@@ -526,16 +636,39 @@ class SAC(DQN):
                 self._counters[NUM_AGENT_STEPS_TRAINED] += train_batch.agent_steps()
                 self._counters[NUM_ENV_STEPS_TRAINED] += train_batch.env_steps()
 
-                # Update replay buffer priorities.
+                # Update replay buffer priorities. Hand over only the
+                # per-module TD-error arrays; the priority update does not
+                # need to re-walk the full results tree.
+                td_errors = {
+                    module_id: res.get("td_error")
+                    for module_id, res in train_results.items()
+                    if module_id != ALL_MODULES
+                }
                 update_priorities_in_episode_replay_buffer(
                     self.local_replay_buffer,
                     self.config,
                     train_batch,
-                    train_results,
+                    td_errors,
                 )
 
-                # Update the target networks if necessary.
-                modules_to_update = set(train_results.keys()) - {ALL_MODULES}
+                # Prefetch the next train batch on the background thread,
+                # hiding the buffer's sampling work behind the (remote) target
+                # network updates below. Note, this must not start before the
+                # priorities were updated above, as `sample()` resets the
+                # buffer's last sampled indices.
+                if iteration < sample_and_train_weight - 1:
+                    sample_future = self._replay_sample_executor.submit(
+                        self.local_replay_buffer.sample,
+                        num_items=self.config.train_batch_size,
+                        n_step=self.config.n_step,
+                        gamma=self.config.gamma,
+                    )
+
+                # Update the target networks if necessary. The module set is
+                # stable across loop iterations, so compute it only once and
+                # reuse it (also for the weight sync below).
+                if modules_to_update is None:
+                    modules_to_update = set(train_results.keys()) - {ALL_MODULES}
                 additional_results = self.learner_group.additional_update(
                     module_ids_to_update=modules_to_update,
                     timestep=self._counters[NUM_AGENT_STEPS_SAMPLED],
@@ -544,21 +677,36 @@ class SAC(DQN):
                 for pid, res in additional_results.items():
                     train_results[pid].update(res)
 
-            # TODO (simon): Check, if this is better - as we are not sampling at the
-            # same time, updating weights after all training iteration should be faster.
             # Update weights and global_vars - after learning on the local worker -
-            # on all remote workers.
-            with self._timers[SYNCH_WORKER_WEIGHTS_TIMER]:
-                if self.workers.num_remote_workers() > 0:
-                    # NOTE: the new API stack does not use global vars.
-                    self.workers.sync_weights(
-                        from_worker_or_learner_group=self.learner_group,
-                        policies=modules_to_update,
-                        global_vars=None,
-                    )
-                # Then we must have a local worker.
-                else:
-                    weights = self.learner_group.get_weights()
-                    self.workers.local_worker().set_weights(weights)
+            # on all remote workers. This runs on a background thread and is
+            # awaited at the start of the next `training_step` call.
+            self._weight_sync_future = self._weight_sync_executor.submit(
+                self._sync_weights_to_workers, modules_to_update
+            )
+
+        # Decouple explorers from the trainer: top up the remote workers'
+        # in-flight sample requests before returning, so rollout production
+        # continues while the driver is busy with metrics, evaluation, and
+        # the next training phase. The results are picked up by the fetch at
+        # the top of the next `training_step` call.
+        if self.workers.num_remote_workers() > 0:
+            self.workers.foreach_worker_async(
+                lambda w: w.sample(),
+                healthy_only=True,
+            )
 
         return train_results
+
+    def _sync_weights_to_workers(self, modules_to_update) -> None:
+        """Syncs the learner group's weights to all rollout workers."""
+        if self.workers.num_remote_workers() > 0:
+            # NOTE: the new API stack does not use global vars.
+            self.workers.sync_weights(
+                from_worker_or_learner_group=self.learner_group,
+                policies=modules_to_update,
+                global_vars=None,
+            )
+        # Then we must have a local worker.
+        else:
+            weights = self.learner_group.get_weights()
+            self.workers.local_worker().set_weights(weights)
@@ -36,6 +36,65 @@ class SACTorchLearner(SACLearner, TorchLearner):
     `self.compute_loss_for_module()` method.
     """
 
+    @override(SACLearner)
+    def build(self) -> None:
+        super().build()
+
+        # Resolve the autocast dtype for mixed precision updates once.
+        self._autocast_dtype = {
+            None: None,
+            "bf16": torch.bfloat16,
+            "fp16": torch.float16,
+        }[self.config.mixed_precision]
+        if self.config.allow_tf32:
+            # Allow PyTorch to run FP32 matmuls on TF32 tensor cores.
+            torch.backends.cuda.matmul.allow_tf32 = True
+            torch.backends.cudnn.allow_tf32 = True
+
+        # The generic forward-train compilation (via
+        # `config.framework(torch_compile_learner=True)`) only covers the
+        # RLModule's `_forward_train`. SAC's loss additionally calls the Q
+        # forward helpers directly, so compile the shared helper, too. The
+        # train batch size is fixed, hence specialize on the input shapes
+        # (`dynamic=False`) to avoid recompilation guards.
+        if self._torch_compile_forward_train:
+            for module_id in self._module.keys():
+                module = self._module[module_id]
+                module._qf_forward_train_helper = torch.compile(
+                    module._qf_forward_train_helper,
+                    backend=self._torch_compile_cfg.torch_dynamo_backend,
+                    mode=self._torch_compile_cfg.torch_dynamo_mode,
+                    **{"dynamic": False, **self._torch_compile_cfg.kwargs},
+                )
+
+    @override(TorchLearner)
+    def _uncompiled_update(
+        self,
+        batch: NestedDict,
+        **kwargs,
+    ):
+        """Performs a single update, under autocast if mixed precision is on."""
+        if self._autocast_dtype is None:
+            return super()._uncompiled_update(batch, **kwargs)
+
+        # Run the forward passes and the loss computation in reduced
+        # precision. Note, autocast keeps reductions and the elementwise
+        # log-alpha/entropy terms in FP32 via its op policies; only the
+        # GEMM-heavy encoder and head passes run in the lower precision.
+        with torch.autocast(
+            device_type=self._device.type if self._device is not None else "cpu",
+            dtype=self._autocast_dtype,
+        ):
+            fwd_out = self.module.forward_train(batch)
+            loss_per_module = self.compute_loss(fwd_out=fwd_out, batch=batch)
+
+        # Backward pass and optimizer steps run outside the autocast context,
+        # as recommended by PyTorch.
+        gradients = self.compute_gradients(loss_per_module)
+        postprocessed_gradients = self.postprocess_gradients(gradients)
+        self.apply_gradients(postprocessed_gradients)
+        return fwd_out, loss_per_module, self._metrics
+
     # TODO (simon): Set different learning rates for optimizers.
     @override(TorchLearner)
     def configure_optimizers_for_module(
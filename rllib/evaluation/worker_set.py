@@ -453,20 +453,27 @@ class WorkerSet:
                 )
             weights = weights_src.get_weights(policies)
 
-            def set_weight(w):
-                w.set_weights(weights, global_vars)
-
-            # Sync to specified remote workers in this WorkerSet.
-            self.foreach_worker(
-                func=set_weight,
-                local_worker=False,  # Do not sync back to local worker.
-                remote_worker_ids=to_worker_indices,
-                # We can only sync to healthy remote workers.
-                # Restored workers need to have local work state synced over first,
-                # before they will have all the policies to receive these weights.
-                healthy_only=True,
-                timeout_seconds=timeout_seconds,
-            )
+            if self.num_remote_workers() > 0:
+                # Put the weights only once into Ray's object store and let
+                # every remote worker fetch that same reference, instead of
+                # re-pickling the identical weights into each remote call.
+                weights_ref = ray.put(weights)
+
+                def set_weight(w):
+                    w.set_weights(ray.get(weights_ref), global_vars)
+
+                # Sync to specified remote workers in this WorkerSet.
+                self.foreach_worker(
+                    func=set_weight,
+                    local_worker=False,  # Do not sync back to local worker.
+                    remote_worker_ids=to_worker_indices,
+                    # We can only sync to healthy remote workers.
+                    # Restored workers need to have local work state synced over
+                    # first, before they will have all the policies to receive
+                    # these weights.
+                    healthy_only=True,
+                    timeout_seconds=timeout_seconds,
+                )
 
         # If `from_worker_or_learner_group` is provided, also sync to this WorkerSet's
         # local worker.
@@ -1,6 +1,8 @@
 import operator
 from typing import Any, Optional
 
+import numpy as np
+
 
 class SegmentTree:
     """A Segment Tree data structure.
@@ -58,8 +60,22 @@ class SegmentTree:
                 else float("inf")
             )
         self.neutral_element = neutral_element
-        self.value = [self.neutral_element for _ in range(2 * capacity)]
+        # Store the tree values in one contiguous array, so that batched
+        # updates (see `update_items`) can scatter and propagate with
+        # vectorized NumPy ops.
+        self.value = np.full(2 * capacity, self.neutral_element, dtype=np.float64)
         self.operation = operation
+        # The vectorized (elementwise) equivalent of `operation`, if known.
+        # `update_items` falls back to per-item `__setitem__` calls otherwise.
+        self._vectorized_operation = (
+            np.add
+            if operation is operator.add
+            else np.maximum
+            if operation is max
+            else np.minimum
+            if operation is min
+            else None
+        )
 
     def reduce(self, start: int = 0, end: Optional[int] = None) -> Any:
         """Applies `self.operation` to subsequence of our values.
@@ -157,6 +173,50 @@ class SegmentTree:
             )
             idx = idx >> 1  # Divide by 2 (faster than division).
 
+    def update_items(self, idxs: Any, vals: Any) -> None:
+        """Batched version of `__setitem__` for many index/value pairs.
+
+        Writes all leaf values in a single vectorized scatter, then
+        re-computes the affected reduction values level by level, visiting
+        each affected parent node exactly once. For B updated items this is
+        O(B log capacity) NumPy work instead of B Python-level tree
+        traversals.
+
+        Args:
+            idxs: The indices to insert to. All must be in
+                [0, `self.capacity`[.
+            vals: The values to insert (same length as `idxs`).
+        """
+        idxs = np.asarray(idxs, dtype=np.int64)
+        vals = np.asarray(vals, dtype=np.float64)
+        assert idxs.shape == vals.shape
+
+        # Fall back to per-item updates for operations without a known
+        # elementwise equivalent.
+        if self._vectorized_operation is None:
+            for idx, val in zip(idxs, vals):
+                self[idx] = val
+            return
+
+        assert ((0 <= idxs) & (idxs < self.capacity)).all(), (
+            f"idxs={idxs} capacity={self.capacity}"
+        )
+
+        # Scatter all leaf values at once (leaves live in the second half of
+        # the array).
+        idxs = idxs + self.capacity
+        self.value[idxs] = vals
+
+        # Recalculate all affected reduction values (in "first half" of
+        # tree), level by level. All leaves sit on the same tree level, so
+        # the affected parents move up the levels in lockstep.
+        parents = np.unique(idxs >> 1)
+        while parents.size and parents[0] >= 1:
+            self.value[parents] = self._vectorized_operation(
+                self.value[2 * parents], self.value[2 * parents + 1]
+            )
+            parents = np.unique(parents >> 1)
+
     def __getitem__(self, idx: int) -> Any:
         assert 0 <= idx < self.capacity
         return self.value[idx + self.capacity]
@@ -166,7 +226,8 @@ class SegmentTree:
 
     def set_state(self, state):
         assert len(state) == self.capacity * 2
-        self.value = state
+        # Accept both plain lists (from older checkpoints) and ndarrays.
+        self.value = np.asarray(state, dtype=np.float64)
 
 
 class SumSegmentTree(SegmentTree):
@@ -484,11 +484,15 @@ class FaultTolerantActorManager:
         )
 
         # Remote data should already be fetched to local object store at this point.
+        # Map each call ref to its list position once, instead of running an
+        # O(N) list.index() scan (twice) per ready call.
+        call_indices = {call: i for i, call in enumerate(remote_calls)}
         remote_results = RemoteCallResults()
         for r in ready:
             # Find the corresponding actor ID for this remote call.
-            actor_id = remote_actor_ids[remote_calls.index(r)]
-            tag = tags[remote_calls.index(r)]
+            call_index = call_indices[r]
+            actor_id = remote_actor_ids[call_index]
+            tag = tags[call_index]
 
             # If caller wants ObjectRefs, return directly without resolve them.
             if return_obj_refs:
@@ -426,18 +426,20 @@ class PrioritizedEpisodeReplayBuffer(EpisodeReplayBuffer):
         """
         assert len(priorities) == len(self._last_sampled_indices)
 
-        for idx, priority in zip(self._last_sampled_indices, priorities):
-            # Note, TD-errors come in as absolute values or results from
-            # cross-entropy loss calculations.
-            assert priority > 0
-            assert 0 <= idx < self.get_num_timesteps()
-            # TODO (simon): Create metrics.
-            # delta = priority**self._alpha - self._sum_segment[idx]
-            # Update the priorities in the segment trees.
-            self._sum_segment[idx] = priority**self._alpha
-            self._min_segment[idx] = priority**self._alpha
-            # Update the maximal priority.
-            self._max_priority = max(self._max_priority, priority)
+        priorities = np.asarray(priorities, dtype=np.float64)
+        idxs = np.asarray(self._last_sampled_indices, dtype=np.int64)
+        # Note, TD-errors come in as absolute values or results from
+        # cross-entropy loss calculations.
+        assert (priorities > 0).all()
+        assert ((0 <= idxs) & (idxs < self.get_num_timesteps())).all()
+        # TODO (simon): Create metrics.
+        # Update the priorities in the segment trees in one batched pass,
+        # instead of one Python-level tree traversal per item.
+        alpha_priorities = priorities**self._alpha
+        self._sum_segment.update_items(idxs, alpha_priorities)
+        self._min_segment.update_items(idxs, alpha_priorities)
+        # Update the maximal priority.
+        self._max_priority = max(self._max_priority, priorities.max())
 
     def _get_free_node_and_assign(self, sample_index, weight: float = 1.0) -> int:
         """Gets the next free node in the segment trees.
@@ -94,6 +94,41 @@ class TestSegmentTree(unittest.TestCase):
         assert np.isclose(tree.min(2, -1), 4.0)
         assert np.isclose(tree.min(3, 4), 3.0)
 
+    def test_tree_batch_update(self):
+        tree = SumSegmentTree(8)
+
+        tree.update_items([2, 3, 5], [1.0, 3.0, 2.0])
+
+        assert np.isclose(tree.sum(), 6.0)
+        assert np.isclose(tree.sum(0, 3), 1.0)
+        assert np.isclose(tree.sum(2, 4), 4.0)
+        assert np.isclose(tree.sum(4, 8), 2.0)
+
+        # Batched updates must match the per-item ones.
+        tree2 = SumSegmentTree(8)
+        tree2[2] = 1.0
+        tree2[3] = 3.0
+        tree2[5] = 2.0
+        assert np.allclose(tree.value, tree2.value)
+
+        # Overwriting previously set items.
+        tree.update_items([3, 5], [0.5, 0.5])
+        assert np.isclose(tree.sum(), 2.0)
+
+    def test_min_tree_batch_update(self):
+        tree = MinSegmentTree(4)
+
+        tree.update_items([0, 2, 3], [1.0, 0.5, 3.0])
+
+        assert np.isclose(tree.min(), 0.5)
+        assert np.isclose(tree.min(0, 2), 1.0)
+        assert np.isclose(tree.min(3, 4), 3.0)
+
+        tree.update_items([2], [4.0])
+
+        assert np.isclose(tree.min(), 1.0)
+        assert np.isclose(tree.min(2, 4), 3.0)
+
 
 if __name__ == "__main__":
     import pytest
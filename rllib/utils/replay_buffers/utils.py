@@ -1,6 +1,6 @@
 import logging
 import psutil
-from typing import Any, Optional, TYPE_CHECKING
+from typing import Any, Dict, Optional, TYPE_CHECKING
 
 import numpy as np
 
@@ -30,20 +30,13 @@ def update_priorities_in_episode_replay_buffer(
     replay_buffer: EpisodeReplayBuffer,
     config: "AlgorithmConfig",
     train_batch: SampleBatchType,
-    train_results: ResultDict,
+    td_errors: Dict[str, Any],
 ) -> None:
     # Only update priorities, if the buffer supports them.
     if isinstance(replay_buffer, PrioritizedEpisodeReplayBuffer):
 
-        # The `ResultDict` will be multi-agent.
-        for module_id, result_dict in train_results.items():
-            # Skip the `"__all__"` key.
-            if module_id == "__all__":
-                continue
-
-            # Get the TD-error from the results.
-            td_error = result_dict.get("td_error", None)
-
+        # The TD-errors come in per module ID (multi-agent).
+        for module_id, td_error in td_errors.items():
             # Warn once, if we have no TD-errors to update priorities.
             if td_error is None:
                 if log_once(
@@ -56,6 +49,10 @@ def update_priorities_in_episode_replay_buffer(
                         "this policy is being skipped."
                     )
                 continue
+            # Make sure the TD-errors form a single contiguous array, so the
+            # buffer can apply them in one batched pass.
+            if isinstance(td_error, list):
+                td_error = np.concatenate(td_error)
             # TODO (simon): Implement multi-agent version.
             assert len(td_error) == len(replay_buffer._last_sampled_indices)
             # TODO (simon): Implement for stateful modules.